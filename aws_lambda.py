@@ -20,7 +20,6 @@ import sys
 from datetime import datetime, timedelta, timezone, date
 from typing import List, Optional, Any, Dict, Tuple
 from dataclasses import dataclass, field
-from dotenv import load_dotenv
 
 from src.database.repository import (
     add_message_to_database,
@@ -38,6 +37,8 @@ logging.basicConfig(
     datefmt="%Y-%m-%d %H:%M:%S",
 )
 
+logger = logging.getLogger(__name__)
+
 # ============================================================================
 # Configuration
 # ============================================================================
@@ -51,41 +52,100 @@ from src.config import config
 from src.models.news import NewsItem, NewsBatch, Summary
 
 
+# ============================================================================
+# JSON
+# ============================================================================
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> str:
+        # API Gateway requires the proxy response body to be a str
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+# ============================================================================
+# Event Loop
+# ============================================================================
+
+try:
+    import uvloop
+
+    _new_event_loop = uvloop.new_event_loop
+except ImportError:
+    _new_event_loop = asyncio.new_event_loop
+
+# One loop per container, kept open across warm invocations so async HTTP
+# clients bound to it keep their connection pools alive between events
+_LOOP = _new_event_loop()
+asyncio.set_event_loop(_LOOP)
+
+
+def _run_async(coro: Any) -> Any:
+    """Run a coroutine to completion on the container-wide event loop."""
+    return _LOOP.run_until_complete(coro)
+
 
 # ============================================================================
 # Webhook Command Processing
 # ============================================================================
 
-def _is_api_gateway_event(event: Dict[str, Any]) -> bool:
+def _event_kind(event: Dict[str, Any]) -> str:
     """
-    Check if the event is from API Gateway.
+    Detect the source of a Lambda event with a single pass over its keys.
     
     Args:
         event: Lambda event object
         
     Returns:
-        True if event is from API Gateway, False otherwise
+        "eventbridge", "apigw" or "unknown"
     """
-    return (
-        "httpMethod" in event or 
+    if event.get("source") == "aws.events":
+        return "eventbridge"
+    # requestContext is present in both REST (v1) and HTTP (v2) API events
+    if (
         "requestContext" in event or 
+        "httpMethod" in event or 
         ("path" in event and "body" in event)
-    )
+    ):
+        return "apigw"
+    return "unknown"
 
 
-def _is_eventbridge_event(event: Dict[str, Any]) -> bool:
-    """
-    Check if the event is from EventBridge.
-    
-    Args:
-        event: Lambda event object
-        
-    Returns:
-        True if event is from EventBridge, False otherwise
-    """
-    return "source" in event and event.get("source") == "aws.events"
+# Prebuilt response for updates that are acknowledged without processing.
+# Telegram only needs a 200 to stop redelivering; the reason is logged instead.
+_ACK_RESPONSE = {
+    "statusCode": 200,
+    "body": _json_dumps({"ok": True})
+}
 
+# Prebuilt responses for processed commands, keyed by success
+_COMMAND_RESPONSES = {
+    success: {
+        "statusCode": 200,
+        "headers": {
+            "Content-Type": "application/json"
+        },
+        "body": _json_dumps({
+            "ok": success,
+            "message": "Command processed" if success else "Failed to process command"
+        })
+    }
+    for success in (True, False)
+}
 
+# Prebuilt response for webhook bodies that are not valid JSON
+_INVALID_JSON_RESPONSE = {
+    "statusCode": 400,
+    "headers": {
+        "Content-Type": "application/json"
+    },
+    "body": _json_dumps({"ok": False, "error": "Invalid JSON in request body"})
+}
 
 
 def handle_webhook_update(event: Dict[str, Any]) -> Dict[str, Any]:
@@ -103,75 +163,76 @@ def handle_webhook_update(event: Dict[str, Any]) -> Dict[str, Any]:
         # Try standard location first, then fallback to requestContext.body for custom setups
         body = event.get("body") or event.get("requestContext", {}).get("body", "{}")
         if isinstance(body, str):
-            update = json.loads(body)
+            update = _json_loads(body)
         else:
             update = body
         
         # Validate update structure
         if "message" not in update:
-            logging.warning("Webhook update does not contain message field")
-            return {
-                "statusCode": 200,  # Return 200 to acknowledge webhook
-                "body": json.dumps({"ok": True, "message": "No message in update"})
-            }
+            logger.warning("Webhook update does not contain message field")
+            return _ACK_RESPONSE
         
         message = update["message"]
         
         # Extract chat_id and message text
         if "chat" not in message or "id" not in message["chat"]:
-            logging.warning("Message does not contain chat.id")
-            return {
-                "statusCode": 200,
-                "body": json.dumps({"ok": True, "message": "No chat ID in message"})
-            }
+            logger.warning("Message does not contain chat.id")
+            return _ACK_RESPONSE
         
         chat_id = message["chat"]["id"]
         message_text = message.get("text", "")
         
         if not message_text:
-            logging.warning(f"No text in message from chat_id {chat_id}")
-            return {
-                "statusCode": 200,
-                "body": json.dumps({"ok": True, "message": "No text in message"})
-            }
+            logger.warning("No text in message from chat_id %s", chat_id)
+            return _ACK_RESPONSE
         
         # Process command
-        logging.info(f"Processing webhook update: chat_id={chat_id}, text={message_text}")
-        success = asyncio.run(process_command(chat_id, message_text, send_message, config.TELEGRAM_BOT_TOKEN))
+        logger.info("Processing webhook update: chat_id=%s, text=%s", chat_id, message_text)
+        success = _run_async(process_command(chat_id, message_text, send_message, config.TELEGRAM_BOT_TOKEN))
         
-        return {
-            "statusCode": 200,
-            "headers": {
-                "Content-Type": "application/json"
-            },
-            "body": json.dumps({
-                "ok": success,
-                "message": "Command processed" if success else "Failed to process command"
-            })
-        }
+        return _COMMAND_RESPONSES[bool(success)]
         
     except json.JSONDecodeError as e:
-        logging.error(f"Failed to parse webhook body: {e}")
-        return {
-            "statusCode": 400,
-            "headers": {
-                "Content-Type": "application/json"
-            },
-            "body": json.dumps({"ok": False, "error": "Invalid JSON in request body"})
-        }
+        logger.error("Failed to parse webhook body: %s", e)
+        return _INVALID_JSON_RESPONSE
     except Exception as e:
-        logging.error(f"Error handling webhook update: {e}")
-        import traceback
-        logging.error(traceback.format_exc())
+        logger.exception("Error handling webhook update: %s", e)
         return {
             "statusCode": 500,
             "headers": {
                 "Content-Type": "application/json"
             },
-            "body": json.dumps({"ok": False, "error": str(e)})
+            "body": _json_dumps({"ok": False, "error": str(e)})
         }
 
 
+def handle_daily_job(event: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run the daily job for a scheduled (or unrecognised) event.
+    
+    Args:
+        event: Lambda event object
+        
+    Returns:
+        Lambda response dictionary
+    """
+    success = _run_async(run_daily_job_async())
+    return {
+        "statusCode": 200,
+        "body": _json_dumps({
+            "success": success
+        })
+    }
+
+
+# Unknown events default to the daily job for backward compatibility
+_EVENT_HANDLERS = {
+    "apigw": handle_webhook_update,
+    "eventbridge": handle_daily_job,
+    "unknown": handle_daily_job,
+}
+
+
 # ============================================================================
 # Standalone Entry Point
 # ============================================================================
@@ -179,40 +240,17 @@ def handle_webhook_update(event: Dict[str, Any]) -> Dict[str, Any]:
 def lambda_handler(event, context):
     try:
         # Detect event source and route accordingly
-        if _is_api_gateway_event(event):
-            logging.info("Detected API Gateway event - processing webhook")
-            return handle_webhook_update(event)
-        elif _is_eventbridge_event(event):
-            logging.info("Detected EventBridge event - running daily job")
-            success = asyncio.run(run_daily_job_async())
-            return {
-                "statusCode": 200,
-                "body": json.dumps({
-                    "success": success
-                })
-            }
-        else:
-            # Default to daily job for backward compatibility
-            logging.info("Unknown event type - defaulting to daily job")
-            success = asyncio.run(run_daily_job_async())
-            return {
-                "statusCode": 200,
-                "body": json.dumps({
-                    "success": success
-                })
-            }
+        kind = _event_kind(event)
+        logger.info("Detected %s event", kind)
+        return _EVENT_HANDLERS[kind](event)
     except Exception as e:
-        import traceback
-        logging.error(f"Error in lambda_handler: {e}")
-        logging.error(traceback.format_exc())
+        logger.exception("Error in lambda_handler: %s", e)
         return {
             "statusCode": 500,
             "headers": {
                 "Content-Type": "application/json"
             },
-            "body": json.dumps({
-                "error": str(e),
-                "trace": traceback.format_exc()
+            "body": _json_dumps({
+                "error": str(e)
             })
         }
-
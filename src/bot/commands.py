@@ -4,9 +4,23 @@ Bot command handlers.
 This module contains all individual command handler functions.
 """
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING
 
+from src.bot.messages import (
+    get_welcome_message,
+    get_subscribe_success_message,
+    get_subscribe_already_message,
+    get_subscribe_error_message,
+    get_unsubscribe_success_message,
+    get_unsubscribe_not_subscribed_message,
+    get_unsubscribe_error_message,
+    get_no_summary_message,
+    get_latest_error_message,
+    get_help_message,
+    get_unknown_command_message,
+)
 from src.database.repository import add_chat_id, remove_chat_id, get_latest_summary
 
 if TYPE_CHECKING:
@@ -29,8 +43,6 @@ async def handle_start_command(chat_id: int, send_message_func, bot_token: str)
     Returns:
         True if message sent successfully, False otherwise
     """
-    from src.bot.messages import get_welcome_message
-    
     welcome_message = get_welcome_message()
     return await send_message_func(bot_token, chat_id, welcome_message)
 
@@ -47,21 +59,15 @@ async def handle_subscribe_command(chat_id: int, send_message_func, bot_token: s
     Returns:
         True if message sent successfully, False otherwise
     """
-    from src.bot.messages import (
-        get_subscribe_success_message,
-        get_subscribe_already_message,
-        get_subscribe_error_message
-    )
-    
     try:
-        success = add_chat_id(chat_id)
+        success = await asyncio.to_thread(add_chat_id, chat_id)
         if success:
             message = get_subscribe_success_message()
         else:
             message = get_subscribe_already_message()
         return await send_message_func(bot_token, chat_id, message)
     except Exception as e:
-        logger.error(f"Error in subscribe command: {e}")
+        logger.error("Error in subscribe command: %s", e)
         error_message = get_subscribe_error_message()
         return await send_message_func(bot_token, chat_id, error_message)
 
@@ -78,21 +84,15 @@ async def handle_unsubscribe_command(chat_id: int, send_message_func, bot_token:
     Returns:
         True if message sent successfully, False otherwise
     """
-    from src.bot.messages import (
-        get_unsubscribe_success_message,
-        get_unsubscribe_not_subscribed_message,
-        get_unsubscribe_error_message
-    )
-    
     try:
-        success = remove_chat_id(chat_id)
+        success = await asyncio.to_thread(remove_chat_id, chat_id)
         if success:
             message = get_unsubscribe_success_message()
         else:
             message = get_unsubscribe_not_subscribed_message()
         return await send_message_func(bot_token, chat_id, message)
     except Exception as e:
-        logger.error(f"Error in unsubscribe command: {e}")
+        logger.error("Error in unsubscribe command: %s", e)
         error_message = get_unsubscribe_error_message()
         return await send_message_func(bot_token, chat_id, error_message)
 
@@ -109,17 +109,15 @@ async def handle_get_latest_command(chat_id: int, send_message_func, bot_token:
     Returns:
         True if message sent successfully, False otherwise
     """
-    from src.bot.messages import get_no_summary_message, get_latest_error_message
-    
     try:
-        summary = get_latest_summary()
+        summary = await asyncio.to_thread(get_latest_summary)
         if summary:
             return await send_message_func(bot_token, chat_id, summary)
         else:
             message = get_no_summary_message()
             return await send_message_func(bot_token, chat_id, message)
     except Exception as e:
-        logger.error(f"Error in get_latest command: {e}")
+        logger.error("Error in get_latest command: %s", e)
         error_message = get_latest_error_message()
         return await send_message_func(bot_token, chat_id, error_message)
 
@@ -136,8 +134,6 @@ async def handle_help_command(chat_id: int, send_message_func, bot_token: str) -
     Returns:
         True if message sent successfully, False otherwise
     """
-    from src.bot.messages import get_help_message
-    
     help_message = get_help_message()
     return await send_message_func(bot_token, chat_id, help_message)
 
@@ -155,8 +151,6 @@ async def handle_unknown_command(chat_id: int, command: str, send_message_func,
     Returns:
         True if message sent successfully, False otherwise
     """
-    from src.bot.messages import get_unknown_command_message
-    
     error_message = get_unknown_command_message(command)
     return await send_message_func(bot_token, chat_id, error_message)
 
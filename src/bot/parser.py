@@ -25,13 +25,13 @@ def parse_command(message_text: str) -> Tuple[Optional[str], List[str]]:
         >>> parse_command("hello")
         (None, [])
     """
-    if not message_text or not message_text.startswith("/"):
+    if not message_text or message_text[0] != "/":
         return None, []
     
-    # Split command and arguments
-    parts = message_text.split()
-    command = parts[0][1:].lower()  # Remove '/' and convert to lowercase
-    args = parts[1:] if len(parts) > 1 else []
+    # Split off the command; arguments are only tokenized if present
+    parts = message_text.split(maxsplit=1)
+    command = parts[0].removeprefix("/").lower()  # Remove '/' and convert to lowercase
+    args = parts[1].split() if len(parts) > 1 else []
     
     return command, args
 
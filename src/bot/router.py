@@ -5,8 +5,10 @@ This module handles routing of parsed commands to their respective handlers.
 """
 
 import logging
+from types import MappingProxyType
 from typing import Callable, Awaitable
 
+from src.bot.messages import get_error_message
 from src.bot.parser import parse_command
 from src.bot.commands import (
     handle_start_command,
@@ -19,6 +21,15 @@ from src.bot.commands import (
 
 logger = logging.getLogger(__name__)
 
+# Command name (without '/') -> handler; read-only so it stays a constant
+_COMMAND_HANDLERS = MappingProxyType({
+    "start": handle_start_command,
+    "subscribe": handle_subscribe_command,
+    "unsubscribe": handle_unsubscribe_command,
+    "get_latest": handle_get_latest_command,
+    "help": handle_help_command,
+})
+
 
 async def process_command(
     chat_id: int,
@@ -42,26 +53,17 @@ async def process_command(
     
     if not command:
         # Not a command, ignore non-command messages
-        logger.info(f"Received non-command message from chat_id {chat_id}, ignoring")
+        logger.info("Received non-command message from chat_id %s, ignoring", chat_id)
         return True
     
     # Route commands to handlers
-    command_handlers = {
-        "start": handle_start_command,
-        "subscribe": handle_subscribe_command,
-        "unsubscribe": handle_unsubscribe_command,
-        "get_latest": handle_get_latest_command,
-        "help": handle_help_command,
-    }
-    
-    handler = command_handlers.get(command)
+    handler = _COMMAND_HANDLERS.get(command)
     
     if handler:
         try:
             return await handler(chat_id, send_message_func, bot_token)
         except Exception as e:
-            logger.error(f"Error processing command {command}: {e}")
-            from src.bot.messages import get_error_message
+            logger.error("Error processing command %s: %s", command, e)
             error_message = get_error_message()
             return await send_message_func(bot_token, chat_id, error_message)
     else:
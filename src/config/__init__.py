@@ -5,15 +5,18 @@ This module provides configuration management for the application.
 """
 
 import os
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Load environment variables from .env for local runs; on Lambda the
+# environment is already populated, so skip importing dotenv entirely
+if os.environ.get("AWS_LAMBDA_FUNCTION_NAME") is None:
+    from dotenv import load_dotenv
+
+    load_dotenv()
 
 from src.config.settings import Config
 
 # Create a global config instance
-config = Config()
+config = Config.from_env()
 
 __all__ = ["Config", "config"]
 
@@ -5,21 +5,44 @@ This module defines the configuration class for managing environment variables.
 """
 
 import os
+from dataclasses import dataclass, fields
 
+# Environment variables that must be set for the daily job to run
+_REQUIRED_VARS = (
+    "TELEGRAM_API_ID", "TELEGRAM_API_HASH", "TELEGRAM_SESSION_STRING",
+    "TELEGRAM_BOT_TOKEN", "OPENAI_API_KEY"
+)
 
+
+@dataclass(frozen=True)
 class Config:
     """Configuration class for managing environment variables."""
     
-    TELEGRAM_API_ID: str = os.getenv("TELEGRAM_API_ID", "")
-    TELEGRAM_API_HASH: str = os.getenv("TELEGRAM_API_HASH", "")
-    TELEGRAM_CHANNEL_USERNAME: str = os.getenv("TELEGRAM_CHANNEL_USERNAME", "MarketTwits")
-    TELEGRAM_SESSION_STRING: str = os.getenv("TELEGRAM_SESSION_STRING", "")
-    TELEGRAM_BOT_TOKEN: str = os.getenv("TELEGRAM_BOT_TOKEN", "")
-    OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
-    OPENAI_MODEL: str = os.getenv("OPENAI_MODEL", "gpt-3.5-turbo")
+    TELEGRAM_API_ID: str = ""
+    TELEGRAM_API_HASH: str = ""
+    TELEGRAM_CHANNEL_USERNAME: str = "MarketTwits"
+    TELEGRAM_SESSION_STRING: str = ""
+    TELEGRAM_BOT_TOKEN: str = ""
+    OPENAI_API_KEY: str = ""
+    OPENAI_MODEL: str = "gpt-3.5-turbo"
     
     @classmethod
-    def validate(cls) -> bool:
+    def from_env(cls) -> "Config":
+        """
+        Build the configuration from environment variables.
+        
+        Each field is read from the variable of the same name, falling back
+        to its default. The environment is read once, when this is called.
+        
+        Returns:
+            Config instance
+        """
+        return cls(**{
+            field.name: os.environ.get(field.name, field.default)
+            for field in fields(cls)
+        })
+    
+    def validate(self) -> bool:
         """
         Validate configuration.
         
@@ -31,12 +54,8 @@ class Config:
         Raises:
             ValueError: If any required environment variables are missing
         """
-        required = [
-            "TELEGRAM_API_ID", "TELEGRAM_API_HASH", "TELEGRAM_SESSION_STRING",
-            "TELEGRAM_BOT_TOKEN", "OPENAI_API_KEY"
-        ]
-        missing = [var for var in required if not getattr(cls, var)]
-        if missing:
+        if not all(getattr(self, var) for var in _REQUIRED_VARS):
+            missing = [var for var in _REQUIRED_VARS if not getattr(self, var)]
             raise ValueError(f"Missing required environment variables: {', '.join(missing)}")
         return True
 
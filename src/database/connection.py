@@ -1,18 +1,57 @@
+import atexit
+import functools
 import logging
 import os
+import time
 from contextlib import contextmanager
-from typing import Iterator, Tuple
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, Sequence, Tuple
 
-import psycopg2
-from psycopg2.extensions import connection as PGConnection, cursor as PGCursor
+if TYPE_CHECKING:
+    # psycopg2 itself is imported on first database use, so invocations that
+    # never touch Postgres (e.g. /help) do not pay for loading it
+    from psycopg2.extensions import connection as PGConnection, cursor as PGCursor
+    from psycopg2.pool import ThreadedConnectionPool
 
 logger = logging.getLogger(__name__)
 
+# Connections are pooled per Lambda container so warm invocations skip the
+# TCP/TLS/auth handshake with Postgres
+_POOL_MIN_CONNECTIONS = 1
+_POOL_MAX_CONNECTIONS = 4
+# Pooled connections idle for longer than this are pinged before reuse, since
+# Postgres or a proxy may have dropped the socket while the container was
+# frozen and psycopg2 only notices once a query fails
+_PING_AFTER_IDLE_SECONDS = 30
 
+_pool: Optional["ThreadedConnectionPool"] = None
+
+# Statements prepared on a pooled connection the first time they run there,
+# as name -> SQL with $n placeholders, so Postgres parses and plans them only
+# once per session
+_prepared_statements: Dict[str, str] = {}
+
+
+def prepare_statement(name: str, sql: str) -> None:
+    """
+    Register a statement to be prepared on pooled connections.
+
+    Callers run it with ``execute_prepared(cursor, name, params)``.
+
+    Args:
+        name: Prepared statement name
+        sql: Statement text using $1, $2, ... placeholders
+    """
+    _prepared_statements[name] = sql
+
+
+@functools.lru_cache(maxsize=1)
 def _get_db_params() -> Tuple[str, str, str, str]:
     """
     Read database connection parameters from environment variables.
 
+    The environment does not change within a container, so the result is
+    cached after the first successful read.
+
     Returns:
         Tuple of (host, name, user, password)
 
@@ -33,50 +72,153 @@ def _get_db_params() -> Tuple[str, str, str, str]:
     return db_host, db_name, db_user, db_password
 
 
-def get_connection() -> PGConnection:
+def _get_pool() -> "ThreadedConnectionPool":
     """
-    Create a new database connection.
+    Get the container-wide connection pool, creating it on first use.
 
     Returns:
-        psycopg2 connection instance
+        psycopg2 ThreadedConnectionPool instance
     """
-    db_host, db_name, db_user, db_password = _get_db_params()
-    logger.info(f"Connecting to database: {db_name} at {db_host}")
-    conn = psycopg2.connect(
-        host=db_host,
-        database=db_name,
-        user=db_user,
-        password=db_password,
-    )
-    logger.info("Successfully connected to database")
-    return conn
+    global _pool
+    if _pool is None:
+        from psycopg2.extensions import connection
+        from psycopg2.pool import ThreadedConnectionPool
+
+        class _PooledConnection(connection):
+            """psycopg2 connection that remembers which statements it has prepared."""
+
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.prepared = set()
+                self.last_used = time.monotonic()
+
+        db_host, db_name, db_user, db_password = _get_db_params()
+        logger.info("Creating connection pool for database: %s at %s", db_name, db_host)
+        _pool = ThreadedConnectionPool(
+            _POOL_MIN_CONNECTIONS,
+            _POOL_MAX_CONNECTIONS,
+            host=db_host,
+            database=db_name,
+            user=db_user,
+            password=db_password,
+            connection_factory=_PooledConnection,
+        )
+        # Close sockets cleanly when the process exits (local runs; Lambda
+        # usually freezes and discards the container instead)
+        atexit.register(_pool.closeall)
+    return _pool
+
+
+def _is_alive(conn: "PGConnection") -> bool:
+    """
+    Check whether a pooled connection can still run queries.
+
+    Connections used recently are trusted; idle ones are pinged.
+
+    Args:
+        conn: Pooled connection to check
+
+    Returns:
+        True if the connection is usable, False otherwise
+    """
+    from psycopg2 import InterfaceError, OperationalError
+
+    if conn.closed:
+        return False
+    if time.monotonic() - conn.last_used < _PING_AFTER_IDLE_SECONDS:
+        return True
+
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1")
+        return True
+    except (OperationalError, InterfaceError):
+        return False
+
+
+def _getconn(pool: "ThreadedConnectionPool") -> "PGConnection":
+    """
+    Borrow a live connection from the pool.
+
+    Connections whose socket was dropped while the container was frozen are
+    discarded instead of being handed out; once every idle connection has
+    been tried, the pool opens a fresh one.
+
+    Args:
+        pool: Connection pool to borrow from
+
+    Returns:
+        Open psycopg2 connection
+    """
+    for _ in range(_POOL_MAX_CONNECTIONS):
+        conn = pool.getconn()
+        if _is_alive(conn):
+            return conn
+        logger.warning("Discarding broken pooled database connection")
+        pool.putconn(conn, close=True)
+    return pool.getconn()
+
+
+def execute_prepared(cur: "PGCursor", name: str, params: Sequence = ()) -> None:
+    """
+    Execute a registered statement, preparing it on first use on this connection.
+
+    Only the statement about to run is prepared, so a fresh connection does not
+    pay a round trip for statements it may never execute.
+
+    Args:
+        cur: Cursor of a pooled connection (tracks its prepared statement names)
+        name: Name the statement was registered under with prepare_statement
+        params: Values for the statement's $n placeholders
+    """
+    conn = cur.connection
+    if name not in conn.prepared:
+        cur.execute(f"PREPARE {name} AS {_prepared_statements[name]}")
+        # PREPARE is not undone by a rollback, so record it right away
+        conn.prepared.add(name)
+
+    if params:
+        placeholders = ", ".join(["%s"] * len(params))
+        cur.execute(f"EXECUTE {name} ({placeholders})", params)
+    else:
+        cur.execute(f"EXECUTE {name}")
 
 
 @contextmanager
-def get_cursor() -> Iterator[Tuple[PGConnection, PGCursor]]:
+def get_cursor() -> Iterator[Tuple["PGConnection", "PGCursor"]]:
     """
     Context manager that yields (connection, cursor) and handles commit/rollback.
 
+    The connection is borrowed from the container-wide pool and returned to it
+    afterwards. Connections broken by the operation are closed rather than
+    returned, so the next caller gets a fresh one.
+
     Usage:
         with get_cursor() as (conn, cur):
             cur.execute(...)
     """
+    pool: ThreadedConnectionPool | None = None
     conn: PGConnection | None = None
     cur: PGCursor | None = None
     try:
-        conn = get_connection()
+        pool = _get_pool()
+        conn = _getconn(pool)
         cur = conn.cursor()
         yield conn, cur
         conn.commit()
     except Exception:
-        if conn:
-            conn.rollback()
+        if conn and not conn.closed:
+            try:
+                conn.rollback()
+            except Exception:
+                logger.warning("Rollback failed on broken database connection")
         logger.exception("Database operation failed")
         raise
     finally:
-        if cur:
+        if cur and not cur.closed:
             cur.close()
         if conn:
-            conn.close()
-
-
+            # Return the connection to the pool instead of closing it, unless
+            # it is no longer usable
+            conn.last_used = time.monotonic()
+            pool.putconn(conn, close=bool(conn.closed))
@@ -1,10 +1,43 @@
 import logging
-from typing import List, Optional
+import time
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
 
-from .connection import get_cursor
+from .connection import execute_prepared, get_cursor, prepare_statement
 
 logger = logging.getLogger(__name__)
 
+# Latest summary cached across warm invocations as (fetched_at, message);
+# summaries change once a day, so /get_latest rarely needs the database
+_LATEST_SUMMARY_TTL_SECONDS = 300
+_latest_summary_cache: Optional[Tuple[float, Optional[str]]] = None
+
+# Subscriber list cached across warm invocations as (fetched_at, chat_ids);
+# dropped whenever this container subscribes or unsubscribes a chat
+_CHAT_IDS_TTL_SECONDS = 60
+_chat_ids_cache: Optional[Tuple[float, List[int]]] = None
+
+prepare_statement(
+    "add_summary",
+    "INSERT INTO twits_summary (timestamp, message) VALUES ($1, $2)",
+)
+prepare_statement("select_chat_ids", "SELECT chat_id FROM chat_ids")
+prepare_statement(
+    "add_chat_id",
+    "INSERT INTO chat_ids (chat_id) VALUES ($1) "
+    "ON CONFLICT (chat_id) DO NOTHING RETURNING chat_id",
+)
+prepare_statement("remove_chat_id", "DELETE FROM chat_ids WHERE chat_id = $1")
+prepare_statement(
+    "latest_summary",
+    "SELECT message FROM twits_summary ORDER BY timestamp DESC LIMIT 1",
+)
+prepare_statement(
+    "latest_summary_since",
+    "SELECT message FROM twits_summary WHERE timestamp >= $1 "
+    "ORDER BY timestamp DESC LIMIT 1",
+)
+
 
 def add_message_to_database(now_utc, message: str) -> None:
     """
@@ -14,39 +47,75 @@ def add_message_to_database(now_utc, message: str) -> None:
         now_utc: UTC timestamp for the message
         message: The message content to store
     """
+    global _latest_summary_cache
     try:
         with get_cursor() as (_, cursor):
-            logger.debug(f"Inserting message with timestamp: {now_utc}")
-            cursor.execute(
-                "INSERT INTO twits_summary (timestamp, message) VALUES (%s, %s)",
-                (now_utc, message),
-            )
+            logger.debug("Inserting message with timestamp: %s", now_utc)
+            execute_prepared(cursor, "add_summary", (now_utc, message))
             logger.info("Successfully inserted message into database")
+        _latest_summary_cache = None
     except Exception:
         logger.exception("Unexpected error while adding message to database")
         raise
 
 
+def add_messages_to_database(rows: Sequence[Tuple[datetime, str]]) -> None:
+    """
+    Add several messages to the database in one statement.
+
+    Args:
+        rows: (UTC timestamp, message content) pairs to store
+    """
+    global _latest_summary_cache
+    if not rows:
+        return
+
+    from psycopg2.extras import execute_values
+
+    try:
+        with get_cursor() as (_, cursor):
+            execute_values(
+                cursor,
+                "INSERT INTO twits_summary (timestamp, message) VALUES %s",
+                rows,
+            )
+            logger.info("Successfully inserted %d messages into database", len(rows))
+        _latest_summary_cache = None
+    except Exception:
+        logger.exception("Unexpected error while adding messages to database")
+        raise
+
+
+def _invalidate_chat_ids() -> None:
+    """Drop the cached subscriber list after a subscription change."""
+    global _chat_ids_cache
+    _chat_ids_cache = None
+
+
 def get_chat_ids() -> List[int]:
     """
     Get all chat IDs from the database.
 
+    A result fetched by this container within the last _CHAT_IDS_TTL_SECONDS
+    is reused.
+
     Returns:
         List of chat IDs as integers
     """
+    global _chat_ids_cache
+    now = time.monotonic()
+    if _chat_ids_cache is not None and now - _chat_ids_cache[0] < _CHAT_IDS_TTL_SECONDS:
+        return _chat_ids_cache[1]
+
     try:
         with get_cursor() as (_, cursor):
             logger.debug("Selecting all chat IDs from chat_ids table")
-            cursor.execute("SELECT * FROM chat_ids")
-            rows = cursor.fetchall()
-
-        chat_ids: List[int] = []
-        for row in rows:
-            if row:
-                chat_id = int(row[0])
-                chat_ids.append(chat_id)
+            execute_prepared(cursor, "select_chat_ids")
+            # BIGINT columns already come back as Python ints
+            chat_ids: List[int] = [row[0] for row in cursor]
 
-        logger.info(f"Successfully retrieved {len(chat_ids)} chat IDs from database")
+        _chat_ids_cache = (now, chat_ids)
+        logger.info("Successfully retrieved %d chat IDs from database", len(chat_ids))
         return chat_ids
     except Exception:
         logger.exception("Unexpected error while fetching chat IDs")
@@ -64,21 +133,18 @@ def add_chat_id(chat_id: int) -> bool:
         True if successfully added, False if already exists or error occurs
     """
     try:
-        from psycopg2 import IntegrityError  # local import to avoid hard dependency
-
-        with get_cursor() as (conn, cursor):
-            try:
-                cursor.execute(
-                    "INSERT INTO chat_ids (chat_id) VALUES (%s)", (chat_id,)
-                )
-                logger.info(f"Successfully added chat_id {chat_id} to database")
-                return True
-            except IntegrityError:
-                conn.rollback()
-                logger.info(f"Chat ID {chat_id} already exists in database")
-                return False
+        with get_cursor() as (_, cursor):
+            execute_prepared(cursor, "add_chat_id", (chat_id,))
+            inserted = cursor.fetchone() is not None
+
+        if inserted:
+            _invalidate_chat_ids()
+            logger.info("Successfully added chat_id %s to database", chat_id)
+        else:
+            logger.info("Chat ID %s already exists in database", chat_id)
+        return inserted
     except Exception:
-        logger.exception(f"Error adding chat_id {chat_id}")
+        logger.exception("Error adding chat_id %s", chat_id)
         return False
 
 
@@ -94,38 +160,58 @@ def remove_chat_id(chat_id: int) -> bool:
     """
     try:
         with get_cursor() as (_, cursor):
-            cursor.execute("DELETE FROM chat_ids WHERE chat_id = %s", (chat_id,))
+            execute_prepared(cursor, "remove_chat_id", (chat_id,))
             if cursor.rowcount > 0:
-                logger.info(f"Successfully removed chat_id {chat_id} from database")
+                _invalidate_chat_ids()
+                logger.info("Successfully removed chat_id %s from database", chat_id)
                 return True
             else:
-                logger.info(f"Chat ID {chat_id} not found in database")
+                logger.info("Chat ID %s not found in database", chat_id)
                 return False
     except Exception:
-        logger.exception(f"Error removing chat_id {chat_id}")
+        logger.exception("Error removing chat_id %s", chat_id)
         return False
 
 
-def get_latest_summary() -> Optional[str]:
+def get_latest_summary(since: Optional[datetime] = None) -> Optional[str]:
     """
     Get the latest summary from the database.
 
+    Without a time bound, a result fetched by this container within the last
+    _LATEST_SUMMARY_TTL_SECONDS is reused.
+
+    Args:
+        since: If given, only consider summaries stored at or after this time
+
     Returns:
         Latest summary message as string, or None if no summary found
     """
+    global _latest_summary_cache
+    now = time.monotonic()
+    if (
+        since is None
+        and _latest_summary_cache is not None
+        and now - _latest_summary_cache[0] < _LATEST_SUMMARY_TTL_SECONDS
+    ):
+        return _latest_summary_cache[1]
+
     try:
         with get_cursor() as (_, cursor):
-            cursor.execute(
-                "SELECT message FROM twits_summary ORDER BY timestamp DESC LIMIT 1"
-            )
+            if since is None:
+                execute_prepared(cursor, "latest_summary")
+            else:
+                execute_prepared(cursor, "latest_summary_since", (since,))
             row = cursor.fetchone()
 
-        if row:
+        message = row[0] if row else None
+        if since is None:
+            _latest_summary_cache = (now, message)
+
+        if message is not None:
             logger.info("Successfully retrieved latest summary from database")
-            return row[0]
         else:
             logger.info("No summaries found in database")
-            return None
+        return message
     except Exception:
         logger.exception("Error getting latest summary")
         return None
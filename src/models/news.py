@@ -9,7 +9,7 @@ from datetime import datetime, date
 from typing import List, Optional, Any
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NewsItem:
     """Model for a single news item."""
     message_id: int
@@ -17,9 +17,28 @@ class NewsItem:
     date: datetime
     views: Optional[int] = None
     forwards: Optional[int] = None
+    
+    @classmethod
+    def from_telethon(cls, message: Any) -> "NewsItem":
+        """
+        Build a news item from a Telethon message.
+        
+        Args:
+            message: telethon.tl.custom.Message with text and date set
+            
+        Returns:
+            NewsItem for the message (Telethon dates are already UTC)
+        """
+        return cls(
+            message.id,
+            message.text,
+            message.date,
+            message.views,
+            message.forwards
+        )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NewsBatch:
     """Model for a batch of news items."""
     items: List[NewsItem]
@@ -28,7 +47,7 @@ class NewsBatch:
     total_count: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Summary:
     """Model for the daily summary."""
     date: Any  # Can be datetime or date
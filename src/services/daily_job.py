@@ -8,13 +8,13 @@ This module orchestrates the daily news processing workflow:
 4. Save summary to database
 """
 
+import asyncio
 import logging
-import traceback
-from datetime import datetime, timedelta, timezone, date
+from datetime import datetime, time, timedelta, timezone, date
 from typing import List, Optional, Tuple
 
-from src.database.repository import add_message_to_database, get_chat_ids
-from src.services.telegram_client import send_message
+from src.database.repository import add_message_to_database, get_chat_ids, get_latest_summary, remove_chat_id
+from src.services.telegram_client import broadcast
 from src.services.news_dumper import TelegramDumper
 from src.services.summarizer import NewsSummarizer
 
@@ -23,6 +23,14 @@ from src.config import config
 
 logger = logging.getLogger(__name__)
 
+# Environment is immutable for the lifetime of a Lambda container, so
+# configuration only needs to be validated once
+_config_validated = False
+
+# Telethon dumper kept connected across warm invocations to avoid
+# re-establishing the MTProto session on every run
+_dumper: Optional[TelegramDumper] = None
+
 
 def _validate_config() -> bool:
     """
@@ -31,27 +39,90 @@ def _validate_config() -> bool:
     Returns:
         True if validation succeeds, False otherwise.
     """
+    global _config_validated
+    if _config_validated:
+        return True
+    
     try:
         config.validate()
+        _config_validated = True
         return True
     except ValueError as e:
-        logger.error(f"Configuration validation failed: {e}")
+        logger.error("Configuration validation failed: %s", e)
         return False
 
 
-def _calculate_target_date() -> Tuple[datetime, date]:
+async def _reset_dumper() -> None:
+    """Disconnect and drop the container-wide TelegramDumper."""
+    global _dumper
+    if _dumper is not None:
+        dumper, _dumper = _dumper, None
+        await dumper.close()
+
+
+async def _get_dumper() -> TelegramDumper:
+    """
+    Get the container-wide TelegramDumper.
+    
+    The dumper connects lazily on first use and is kept for later runs.
+    Telethon reports a client as connected while it retries a dropped socket,
+    so only a dumper whose client gave up reconnecting (or never connected)
+    is closed and replaced here; its fetch errors are logged rather than
+    raised, so the job's own reset would not catch it.
+    
+    Returns:
+        TelegramDumper instance
+    """
+    global _dumper
+    if _dumper is not None and not _dumper.is_connected():
+        await _reset_dumper()
+    if _dumper is None:
+        _dumper = TelegramDumper()
+    return _dumper
+
+
+def _remove_unreachable_chats(chat_ids: List[int]) -> None:
+    """
+    Unsubscribe chats that blocked the bot or no longer exist.
+    
+    Args:
+        chat_ids: Chat IDs that can no longer receive messages
+    """
+    logger.info("Removing %d unreachable chats", len(chat_ids))
+    for chat_id in chat_ids:
+        remove_chat_id(chat_id)
+
+
+def _calculate_target_date() -> Tuple[datetime, datetime, date]:
     """
     Calculate the target date (yesterday) for processing.
     
     Returns:
-        Tuple of (yesterday datetime, yesterday date)
+        Tuple of (run timestamp, yesterday datetime, yesterday date)
     """
     now_utc = datetime.now(timezone.utc)
     yesterday = now_utc - timedelta(days=1)
     yesterday_date = yesterday.date()
     
-    logger.info(f"Processing news for {yesterday_date}")
-    return yesterday, yesterday_date
+    logger.info("Processing news for %s", yesterday_date)
+    return now_utc, yesterday, yesterday_date
+
+
+def _get_stored_summary_message(target_date: date) -> Optional[str]:
+    """
+    Get the summary message an earlier attempt already stored for the target date.
+    
+    Summaries are stored the day after the date they cover, so a message saved
+    since that midnight means this run is a retry of the same job.
+    
+    Args:
+        target_date: Target date of the summary
+        
+    Returns:
+        Stored summary message if found, None otherwise.
+    """
+    since = datetime.combine(target_date + timedelta(days=1), time.min, tzinfo=timezone.utc)
+    return get_latest_summary(since=since)
 
 
 async def _fetch_news_for_date(
@@ -74,10 +145,10 @@ async def _fetch_news_for_date(
     news_items = await dumper.dump_news_for_date(target_datetime)
     
     if not news_items:
-        logger.warning(f"No news found for {target_date}")
+        logger.warning("No news found for %s", target_date)
         return None
     
-    logger.info(f"Found {len(news_items)} news items for {target_date}")
+    logger.info("Found %d news items for %s", len(news_items), target_date)
     return news_items
 
 
@@ -118,43 +189,42 @@ def _format_summary_message(summary: Summary) -> str:
         Formatted message string
     """
     date_str = summary._format_date(summary.date)
-    message = f"📈 <b>Daily Market Summary - {date_str}</b>\n\n"
-    message += f"{summary.summary_text}\n\n"
     
+    key_topics_block = ""
     if summary.key_topics:
-        key_topics = [f"{idx+1}. {topic}" for idx, topic in enumerate(summary.key_topics)]
-        key_topics = '\n'.join(key_topics)
-        message += f"🔑 <b>Key Topics:</b>\n{key_topics}\n\n"
+        key_topics = '\n'.join(f"{idx}. {topic}" for idx, topic in enumerate(summary.key_topics, 1))
+        key_topics_block = f"🔑 <b>Key Topics:</b>\n{key_topics}\n\n"
     
-    message += f"📊 Based on {summary.news_count} news items"
-    return message
+    return (
+        f"📈 <b>Daily Market Summary - {date_str}</b>\n\n"
+        f"{summary.summary_text}\n\n"
+        f"{key_topics_block}"
+        f"📊 Based on {summary.news_count} news items"
+    )
 
 
-async def _send_summary_to_user(
-    user_id: int,
-    message: str,
-    bot_token: str
-) -> bool:
+def _save_summary(timestamp: datetime, message: str) -> None:
     """
-    Send summary message to a single user.
+    Save the summary message to the database.
     
     Args:
-        user_id: Telegram user ID to send message to
+        timestamp: UTC timestamp for database entry
         message: Formatted message string
-        bot_token: Telegram bot token
-        
-    Returns:
-        True if message sent successfully, False otherwise.
     """
-    success = await send_message(bot_token, user_id, message)
-    return success
+    try:
+        add_message_to_database(timestamp, message)
+        logger.info("Successfully saved message to database")
+    except Exception as e:
+        logger.error("Failed to save message to database: %s", e)
+        # Don't fail the job if database save fails
 
 
 async def _send_and_save_summary(
     chat_ids: List[int],
     message: str,
     timestamp: datetime,
-    bot_token: str
+    bot_token: str,
+    save: bool = True
 ) -> bool:
     """
     Send summary message to all chat IDs and save to database.
@@ -164,19 +234,39 @@ async def _send_and_save_summary(
         message: Formatted message string
         timestamp: UTC timestamp for database entry
         bot_token: Telegram bot token
+        save: Whether to store the message (False if it is already stored)
         
     Returns:
         True if at least one message sent successfully, False otherwise.
     """
+    # Store the summary while the broadcast runs; both only wait on I/O
+    save_task = None
+    if save:
+        save_task = asyncio.create_task(asyncio.to_thread(_save_summary, timestamp, message))
+    
     try:
-        add_message_to_database(timestamp, message)
-        logger.info("Successfully saved message to database")
-    except Exception as e:
-        logger.error(f"Failed to save message to database: {e}")
-        # Don't fail the job if database save fails
+        return await _broadcast_summary(chat_ids, message, bot_token)
+    finally:
+        if save_task is not None:
+            await save_task
 
+
+async def _broadcast_summary(chat_ids: List[int], message: str, bot_token: str) -> bool:
+    """
+    Send summary message to all chat IDs.
+    
+    Args:
+        chat_ids: List of Telegram chat IDs to send message to
+        message: Formatted message string
+        bot_token: Telegram bot token
+        
+    Returns:
+        True if at least one message sent successfully, False otherwise.
+    """
     logger.info("Step 3: Sending summary to users...")
     
+    # Never send the same summary to a chat twice
+    chat_ids = list(dict.fromkeys(chat_ids))
     total_count = len(chat_ids)
     success_count = 0
     
@@ -184,20 +274,26 @@ async def _send_and_save_summary(
         logger.warning("No chat IDs found to send messages to")
         return False
     
-    # Send message to each chat ID
-    for chat_id in chat_ids:
-        try:
-            success = await _send_summary_to_user(chat_id, message, bot_token)
-            if success:
-                success_count += 1
-                logger.debug(f"Successfully sent message to chat_id: {chat_id}")
-            else:
-                logger.warning(f"Failed to send message to chat_id: {chat_id}")
-        except Exception as e:
-            logger.error(f"Error sending message to chat_id {chat_id}: {e}")
+    # Send message to all chat IDs concurrently, bounded by Telegram's rate limit
+    unreachable_chat_ids: List[int] = []
+    results = await broadcast(
+        bot_token, chat_ids, message, on_unreachable=unreachable_chat_ids.append
+    )
+
+    for chat_id, result in zip(chat_ids, results):
+        if result is True:
+            success_count += 1
+            logger.debug("Successfully sent message to chat_id: %s", chat_id)
+        elif isinstance(result, Exception):
+            logger.error("Error sending message to chat_id %s: %s", chat_id, result)
+        else:
+            logger.warning("Failed to send message to chat_id: %s", chat_id)
     
     # Log success rate
-    logger.info(f"Message sending completed: {success_count}/{total_count} successful")
+    logger.info("Message sending completed: %s/%s successful", success_count, total_count)
+    
+    if unreachable_chat_ids:
+        await asyncio.to_thread(_remove_unreachable_chats, unreachable_chat_ids)
     
     return success_count > 0
 
@@ -217,31 +313,46 @@ async def run_daily_job_async() -> bool:
             return False
         
         # Step 2: Initialize components
-        dumper = TelegramDumper()
+        dumper = await _get_dumper()
         summarizer = NewsSummarizer()
         
         try:
             # Step 3: Calculate target date
-            target_datetime, target_date = _calculate_target_date()
-            
-            # Step 4: Fetch news items
-            news_items = await _fetch_news_for_date(dumper, target_datetime, target_date)
-            if news_items is None:
-                return False
+            now_utc, target_datetime, target_date = _calculate_target_date()
             
-            # Step 5: Create summary
-            summary = await _create_summary_from_news(summarizer, news_items, target_date)
-            if summary is None:
-                return False
+            # A retried run reuses the stored summary instead of calling OpenAI again
+            message = await asyncio.to_thread(_get_stored_summary_message, target_date)
+            is_retry = message is not None
             
-            # Step 6: Format message
-            message = _format_summary_message(summary)
+            if is_retry:
+                logger.info("Summary for %s already stored, skipping fetch and summarization", target_date)
+                chat_ids = await asyncio.to_thread(get_chat_ids)
+            else:
+                # Step 4: Fetch news items
+                news_items = await _fetch_news_for_date(dumper, target_datetime, target_date)
+                if news_items is None:
+                    return False
+                
+                # Step 5: Create summary, loading subscribers while OpenAI responds.
+                # The task group cancels the other task if either one fails, so
+                # nothing is left running on the loop reused by the next event.
+                async with asyncio.TaskGroup() as tg:
+                    summary_task = tg.create_task(
+                        _create_summary_from_news(summarizer, news_items, target_date)
+                    )
+                    chat_ids_task = tg.create_task(asyncio.to_thread(get_chat_ids))
+                summary = summary_task.result()
+                chat_ids = chat_ids_task.result()
+                if summary is None:
+                    return False
+                
+                # Step 6: Format message
+                message = _format_summary_message(summary)
             
             # Step 7: Send message and save to database
-            now_utc = datetime.now(timezone.utc)
-            chat_ids = get_chat_ids()
-            # chat_ids = [427988146]
-            success = await _send_and_save_summary(chat_ids, message, now_utc, config.TELEGRAM_BOT_TOKEN)
+            success = await _send_and_save_summary(
+                chat_ids, message, now_utc, config.TELEGRAM_BOT_TOKEN, save=not is_retry
+            )
             
             if success:
                 logger.info("Daily job completed successfully!")
@@ -250,11 +361,12 @@ async def run_daily_job_async() -> bool:
                 logger.error("Failed to send message to any user")
                 return False
                 
-        finally:
-            await dumper.close()
+        except Exception:
+            # Start from a fresh Telegram session on the next run
+            await _reset_dumper()
+            raise
             
     except Exception as e:
-        logger.error(f"Error in daily job: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error in daily job: %s", e)
         return False
 
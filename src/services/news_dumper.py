@@ -5,14 +5,92 @@ This module provides functionality for fetching messages from Telegram channels.
 """
 
 import logging
+import os
 from typing import List, Optional
-from datetime import datetime, timezone
+from datetime import datetime, timezone, date, time, timedelta
 
 from src.models.news import NewsItem
 from src.config import config
 
+try:
+    from telethon import TelegramClient
+    from telethon.sessions import SQLiteSession, StringSession
+except ImportError:
+    TelegramClient = None
+    SQLiteSession = None
+    StringSession = None
+
 logger = logging.getLogger(__name__)
 
+# Lambda's /tmp survives across warm invocations of the same container
+_LAST_ID_DIR = "/tmp"
+# Telethon session file; keeps the auth key and entity cache between
+# warm invocations instead of starting from the in-memory StringSession
+_SESSION_PATH = "/tmp/tg.session"
+
+
+def _last_id_path(day: date) -> str:
+    """Get the path of the file caching the newest message ID for a day."""
+    return os.path.join(_LAST_ID_DIR, f"last_id_{day:%Y%m%d}")
+
+
+def _read_last_id(day: date) -> int:
+    """
+    Read the cached newest message ID for a day.
+    
+    Args:
+        day: Day the message ID was recorded for
+        
+    Returns:
+        Cached message ID, or 0 if nothing is cached
+    """
+    try:
+        with open(_last_id_path(day)) as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return 0
+
+
+def _write_last_id(day: date, message_id: int) -> None:
+    """
+    Cache the newest message ID seen for a day.
+    
+    Args:
+        day: Day the messages belong to
+        message_id: Newest message ID of that day
+    """
+    try:
+        with open(_last_id_path(day), "w") as f:
+            f.write(str(message_id))
+    except OSError as e:
+        logger.warning("Failed to cache last message ID for %s: %s", day, e)
+
+
+def _open_session(session_string: str):
+    """
+    Open the on-disk Telethon session, seeding it from a session string.
+    
+    Falls back to an in-memory StringSession if /tmp is not usable.
+    
+    Args:
+        session_string: Telethon StringSession to seed a new session file from
+        
+    Returns:
+        Telethon session instance
+    """
+    try:
+        session = SQLiteSession(_SESSION_PATH)
+        if session.auth_key is None:
+            seed = StringSession(session_string)
+            session.set_dc(seed.dc_id, seed.server_address, seed.port)
+            session.auth_key = seed.auth_key
+            session.save()
+            logger.info("Seeded Telegram session file %s", _SESSION_PATH)
+        return session
+    except Exception as e:
+        logger.warning("Falling back to in-memory Telegram session: %s", e)
+        return StringSession(session_string)
+
 
 class TelegramDumper:
     """Telegram channel dumper using Telethon."""
@@ -32,49 +110,69 @@ class TelegramDumper:
         self.channel_username = channel_username or config.TELEGRAM_CHANNEL_USERNAME
         self.session_string = session_string or config.TELEGRAM_SESSION_STRING
         self.client = None
-        self._is_connected = False
+        self._channel = None
+    
+    def is_connected(self) -> bool:
+        """
+        Check whether the Telegram client is connected.
+        
+        Telethon keeps reporting True while it reconnects a dropped socket and
+        only returns False before the first connect or once its retries run out.
+        """
+        return self.client is not None and self.client.is_connected()
     
     async def connect(self) -> bool:
         """Connect to Telegram."""
+        if TelegramClient is None:
+            logger.error("Telethon not installed. Install with: pip install telethon")
+            return False
+        
         try:
-            from telethon import TelegramClient
-            from telethon.sessions import StringSession
-            
-            self.client = TelegramClient(
-                StringSession(self.session_string),
-                self.api_id,
-                self.api_hash
-            )
+            # Reuse a client whose connection dropped; its session stays valid
+            if self.client is None:
+                self.client = TelegramClient(
+                    _open_session(self.session_string),
+                    self.api_id,
+                    self.api_hash
+                )
             await self.client.start()
-            self._is_connected = True
             logger.info("Connected to Telegram")
             return True
-        except ImportError:
-            logger.error("Telethon not installed. Install with: pip install telethon")
-            return False
         except Exception as e:
-            logger.error(f"Failed to connect to Telegram: {e}")
+            logger.error("Failed to connect to Telegram: %s", e)
             return False
     
     async def close(self):
         """Close Telegram connection."""
-        if self.client and self._is_connected:
+        # Disconnecting also closes the session file, even if the client
+        # already gave up reconnecting
+        if self.client is not None:
             await self.client.disconnect()
-            self._is_connected = False
             logger.info("Disconnected from Telegram")
     
+    async def _get_channel(self):
+        """
+        Resolve the channel peer, caching it after the first lookup.
+        
+        Returns:
+            InputPeerChannel for the configured channel username
+        """
+        if self._channel is None:
+            self._channel = await self.client.get_input_entity(self.channel_username)
+        return self._channel
+    
     async def get_channel_messages(
         self, 
         from_date: Optional[datetime] = None, 
         limit: int = 1000
     ) -> List[NewsItem]:
         """Get messages from the Telegram channel."""
-        if not self._is_connected:
+        if not self.is_connected():
             if not await self.connect():
                 return []
         
         try:
-            channel = await self.client.get_entity(self.channel_username)
+            channel = await self._get_channel()
             messages = []
             
             async for message in self.client.iter_messages(
@@ -82,20 +180,13 @@ class TelegramDumper:
                 offset_date=from_date,
                 limit=limit
             ):
-                if message.text:
-                    news_item = NewsItem(
-                        message_id=message.id,
-                        text=message.text,
-                        date=message.date,
-                        views=getattr(message, 'views', None),
-                        forwards=getattr(message, 'forwards', None)
-                    )
-                    messages.append(news_item)
+                if message.text and not message.text.isspace():
+                    messages.append(NewsItem.from_telethon(message))
             
-            logger.info(f"Fetched {len(messages)} messages from channel")
+            logger.info("Fetched %d messages from channel", len(messages))
             return messages
         except Exception as e:
-            logger.error(f"Failed to get channel messages: {e}")
+            logger.error("Failed to get channel messages: %s", e)
             return []
     
     async def dump_news_for_date(self, target_date: datetime) -> List[NewsItem]:
@@ -109,48 +200,53 @@ class TelegramDumper:
             List of NewsItem objects for the target date
         """
         try:
-            target_start = target_date.replace(
-                hour=0, minute=0, second=0, microsecond=0, tzinfo=timezone.utc
-            )
-            target_end = target_date.replace(
-                hour=23, minute=59, second=59, microsecond=999999, tzinfo=timezone.utc
-            )
+            target_start = datetime.combine(target_date.date(), time.min, tzinfo=timezone.utc)
+            target_end = target_start + timedelta(days=1)
 
-            logger.info(f"Dumping news for {target_start.date()}")
+            logger.info("Dumping news for %s", target_start.date())
 
-            if not self._is_connected:
+            if not self.is_connected():
                 if not await self.connect():
                     return []
 
-            channel = await self.client.get_entity(self.channel_username)
+            channel = await self._get_channel()
 
             filtered_messages = []
+            newest_id = None
+
+            # Walk the day oldest-first from its start and stop at the next
+            # midnight, so no history outside the window is requested. The
+            # previous day's newest ID (if cached) bounds the scan as well.
+            min_id = _read_last_id(target_start.date() - timedelta(days=1))
 
             async for message in self.client.iter_messages(
                 channel,
-                offset_date=target_end,
-                limit=2000
+                offset_date=target_start,
+                min_id=min_id,
+                reverse=True,
+                limit=None,
+                # An unbounded limit makes Telethon sleep 1s between pages;
+                # the date bound already caps how many pages are fetched
+                wait_time=0
             ):
+                # Telethon message dates are already timezone-aware UTC
                 if not message.date:
                     continue
 
-                msg_date = message.date.astimezone(timezone.utc)
-
-                if msg_date < target_start:
+                if message.date >= target_end:
                     break  # ⬅️ VERY IMPORTANT
 
-                if message.text:
-                    filtered_messages.append(
-                        NewsItem(
-                            message_id=message.id,
-                            text=message.text,
-                            date=msg_date,
-                            views=getattr(message, "views", None),
-                            forwards=getattr(message, "forwards", None),
-                        )
-                    )
-
-            logger.info(f"Found {len(filtered_messages)} messages for {target_start.date()}")
+                newest_id = message.id
+
+                if not message.text or message.text.isspace():
+                    continue
+
+                filtered_messages.append(NewsItem.from_telethon(message))
+
+            if newest_id is not None:
+                _write_last_id(target_start.date(), newest_id)
+
+            logger.info("Found %d messages for %s", len(filtered_messages), target_start.date())
             return filtered_messages
 
         except Exception:
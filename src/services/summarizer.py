@@ -4,51 +4,42 @@ News summarizer service.
 This module provides functionality for summarizing news using OpenAI API.
 """
 
+import asyncio
 import json
 import logging
+import re
 from typing import List, Optional
 from datetime import date
 
 from src.models.news import NewsItem, Summary
 from src.config import config
 
-logger = logging.getLogger(__name__)
+try:
+    from openai import AsyncOpenAI
+except ImportError:
+    AsyncOpenAI = None
 
+try:
+    import orjson
 
-class NewsSummarizer:
-    """News summarizer using OpenAI API."""
-    
-    def __init__(self, api_key: str = None, model: str = None):
-        """
-        Initialize the summarizer.
-        
-        Args:
-            api_key: OpenAI API key (defaults to config.OPENAI_API_KEY)
-            model: OpenAI model name (defaults to config.OPENAI_MODEL)
-        """
-        self.api_key = api_key or config.OPENAI_API_KEY
-        self.model = model or config.OPENAI_MODEL
-    
-    def _create_prompt(self, news_items: List[str], date: str) -> str:
-        """Create summarization prompt."""
-        all_news = "\n".join([f"• {item}" for item in news_items])
-        
-        return f"""
-Сегодня {date}
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
-Дай мне краткое резюме на основе твитов из новостного канала о финансовых рынках. Дай мне только основные новости о мировом рынке и политике, не используй российские новости, криптовалюты, мемы, кроме случаев, когда они важны.
+logger = logging.getLogger(__name__)
 
-ВОТ все твиты:
-"
-{all_news}
-"
+# Static summarization instructions. They are sent first and never vary, so
+# OpenAI can serve them from its prompt cache; only the user message changes.
+_SYSTEM_PROMPT = """You are a professional financial news analyst.
+
+Дай мне краткое резюме на основе твитов из новостного канала о финансовых рынках. Дай мне только основные новости о мировом рынке и политике, не используй российские новости, криптовалюты, мемы, кроме случаев, когда они важны.
 
 Используй формат как пронумерованный список кратких новостей, отсортированных от самых важных к менее важным.
 
-Формат ответа СТРОГО в Json:
-{{
+Формат ответа СТРОГО в JSON:
+{
     "key_topics": ["важная новость 1", "важная новость 2", ...]
-}}
+}
 
 Фокусируйся на:
 - Крупных движениях мировых рынков
@@ -67,6 +58,152 @@ class NewsSummarizer:
 
 Пиши на русском языке в формате списка ( до 10 новостей)
 """
+
+# Per-run part of the prompt, placed last so the cached prefix stays stable
+_USER_PROMPT_TEMPLATE = """Сегодня {date}
+
+ВОТ все твиты:
+"
+{all_news}
+"
+"""
+
+# Character budget for the tweets included in the prompt
+_MAX_NEWS_CHARS = 8000
+# Tweets shorter than this carry no market information worth summarizing
+_MIN_NEWS_LENGTH = 20
+# Collapses whitespace when normalizing tweets for duplicate detection
+_WS_RE = re.compile(r"\s+")
+# Markdown code fences some models wrap around JSON answers
+_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$")
+
+
+def _select_news_texts(news_items: List[NewsItem]) -> List[str]:
+    """
+    Pick the tweets to include in the prompt.
+    
+    Drops very short tweets and duplicates (compared case- and
+    whitespace-insensitively), then keeps whole tweets in order of
+    engagement until the character budget is used up.
+    
+    Args:
+        news_items: List of NewsItem objects to choose from
+        
+    Returns:
+        List of tweet texts, most engaging first
+    """
+    ranked = sorted(
+        news_items,
+        key=lambda item: (item.views or 0) + 2 * (item.forwards or 0),
+        reverse=True
+    )
+    
+    seen = set()
+    selected = []
+    total_length = 0
+    for item in ranked:
+        text = item.text.strip()
+        if len(text) < _MIN_NEWS_LENGTH:
+            continue
+        
+        normalized = _WS_RE.sub(" ", text.lower())
+        if normalized in seen:
+            continue
+        seen.add(normalized)
+        
+        # "• " prefix and newline added by _create_prompt
+        length = len(text) + 3
+        if total_length + length > _MAX_NEWS_CHARS:
+            continue
+        selected.append(text)
+        total_length += length
+    
+    return selected
+
+
+def _parse_key_topics(content: str) -> List[str]:
+    """
+    Extract the key topics from the model's JSON answer.
+    
+    JSON mode guarantees valid JSON but not its shape (json_schema response
+    formats are not available for gpt-3.5-turbo), so the shape is checked
+    here. Code fences are stripped defensively for models that still add them.
+    
+    Args:
+        content: Message content returned by OpenAI
+        
+    Returns:
+        Non-blank topic strings, or an empty list if the answer is not an
+        object with a "key_topics" list
+    """
+    try:
+        summary_data = _json_loads(_FENCE_RE.sub("", content))
+    except json.JSONDecodeError:
+        logger.warning("OpenAI response is not valid JSON")
+        return []
+    
+    key_topics = summary_data.get("key_topics") if isinstance(summary_data, dict) else None
+    if not isinstance(key_topics, list):
+        logger.warning("OpenAI response has no key_topics list")
+        return []
+    
+    return [topic.strip() for topic in key_topics if isinstance(topic, str) and topic.strip()]
+
+
+_client = None
+_client_loop = None
+
+
+async def _get_client(api_key: str):
+    """
+    Get a shared AsyncOpenAI client for the given API key.
+    
+    The client is kept for the life of the container so later summaries skip
+    the TLS handshake with OpenAI. It is closed and recreated when the API key
+    or the running event loop no longer matches the one it was made for.
+    
+    Args:
+        api_key: OpenAI API key
+        
+    Returns:
+        openai.AsyncOpenAI instance
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is not None and _client.api_key == api_key and _client_loop is loop:
+        return _client
+    
+    old_client = _client
+    _client = AsyncOpenAI(api_key=api_key)
+    _client_loop = loop
+    
+    if old_client is not None:
+        try:
+            await old_client.close()
+        except Exception as e:
+            logger.warning("Failed to close replaced OpenAI client: %s", e)
+    return _client
+
+
+class NewsSummarizer:
+    """News summarizer using OpenAI API."""
+    
+    def __init__(self, api_key: str = None, model: str = None):
+        """
+        Initialize the summarizer.
+        
+        Args:
+            api_key: OpenAI API key (defaults to config.OPENAI_API_KEY)
+            model: OpenAI model name (defaults to config.OPENAI_MODEL)
+        """
+        self.api_key = api_key or config.OPENAI_API_KEY
+        self.model = model or config.OPENAI_MODEL
+    
+    def _create_prompt(self, news_items: List[str], date: str) -> str:
+        """Create the per-run user prompt; instructions live in _SYSTEM_PROMPT."""
+        all_news = "\n".join("• " + item for item in news_items)
+        
+        return _USER_PROMPT_TEMPLATE.format(date=date, all_news=all_news)
     
     async def summarize_news(self, news_items: List[NewsItem], target_date: date) -> Optional[Summary]:
         """
@@ -79,47 +216,48 @@ class NewsSummarizer:
         Returns:
             Summary object if successful, None otherwise
         """
+        if AsyncOpenAI is None:
+            logger.error("OpenAI library not installed. Install with: pip install openai")
+            return None
+        
         try:
-            from openai import AsyncOpenAI
-            
-            client = AsyncOpenAI(api_key=self.api_key)
+            client = await _get_client(self.api_key)
             
-            news_texts = [item.text for item in news_items if item.text.strip()]
+            news_texts = _select_news_texts(news_items)
             if not news_texts:
                 logger.warning("No text content found in news items")
                 return None
             
-            # Limit text length
-            max_length = 8000
-            combined_text = "\n\n".join(news_texts)
-            if len(combined_text) > max_length:
-                combined_text = combined_text[:max_length] + "..."
-                news_texts = [combined_text]
-            
             date_str = target_date.strftime("%Y-%m-%d")
             prompt = self._create_prompt(news_texts, date_str)
             
-            logger.info(f"Calling OpenAI API to summarize {len(news_items)} news items...")
+            logger.info(
+                "Calling OpenAI API to summarize %d news items (%d selected for the prompt)...",
+                len(news_items), len(news_texts)
+            )
             
             response = await client.chat.completions.create(
                 model=self.model,
                 messages=[
-                    {"role": "system", "content": "You are a professional financial news analyst."},
+                    {"role": "system", "content": _SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=1000,
-                temperature=0
+                temperature=0,
+                response_format={"type": "json_object"}
             )
             
+            usage_details = getattr(response.usage, "prompt_tokens_details", None)
+            cached_tokens = getattr(usage_details, "cached_tokens", None)
+            if cached_tokens is not None:
+                logger.info(
+                    "OpenAI prompt tokens: %d (%d cached)",
+                    response.usage.prompt_tokens, cached_tokens
+                )
+            
             content = response.choices[0].message.content.strip()
             
-            # Parse JSON response
-            try:
-                summary_data = json.loads(content)
-                # logger.info(f"Summary data: {summary_data}")
-                key_topics = summary_data.get("key_topics", [])
-            except json.JSONDecodeError:
-                key_topics = []
+            key_topics = _parse_key_topics(content)
             
             summary = Summary(
                 date=target_date,
@@ -130,10 +268,7 @@ class NewsSummarizer:
             logger.info("Successfully created news summary")
             return summary
             
-        except ImportError:
-            logger.error("OpenAI library not installed. Install with: pip install openai")
-            return None
         except Exception as e:
-            logger.error(f"Failed to summarize news: {e}")
+            logger.error("Failed to summarize news: %s", e)
             return None
 
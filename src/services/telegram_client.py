@@ -4,12 +4,96 @@ Telegram bot client service.
 This module provides functionality for sending messages via Telegram bot API.
 """
 
+import asyncio
 import logging
+from typing import Callable, List, Optional, Union
+
+try:
+    from telegram import Bot
+    from telegram.error import BadRequest, Forbidden, NetworkError, RetryAfter, TelegramError
+    from telegram.request import HTTPXRequest
+except ImportError:
+    Bot = None
+    BadRequest = Forbidden = NetworkError = RetryAfter = TelegramError = None
+    HTTPXRequest = None
 
 logger = logging.getLogger(__name__)
 
+# Size of the HTTP connection pool shared by concurrent sends
+_CONNECTION_POOL_SIZE = 32
+
+# Maximum number of in-flight sends in a broadcast (global bot limit is ~30 msg/s)
+_BROADCAST_CONCURRENCY = 25
+# Broadcast sends start in one-second windows of this many messages, since
+# bounding concurrency alone does not bound the rate when replies are fast
+_BROADCAST_BATCH_SIZE = 25
+
+# Attempts per message for rate-limited or network-failed sends
+_SEND_ATTEMPTS = 3
+# First network-error backoff; doubled on every further attempt
+_BACKOFF_BASE_SECONDS = 0.5
 
-async def send_message(bot_token: str, user_id: int, message: str) -> bool:
+
+def _is_unreachable_chat(error: Exception) -> bool:
+    """
+    Check whether a send error means the chat can never receive messages.
+    
+    Args:
+        error: Exception raised by Bot.send_message
+        
+    Returns:
+        True if the bot was blocked or the chat no longer exists
+    """
+    if isinstance(error, Forbidden):
+        return True
+    return isinstance(error, BadRequest) and "chat not found" in str(error).lower()
+
+
+_bot = None
+_bot_request = None
+_bot_loop = None
+
+
+async def _get_bot(bot_token: str):
+    """
+    Get a shared Bot instance for the given token.
+    
+    Keeping one bot per container lets warm sends reuse its HTTPX connection
+    pool. A bot created for a different token or event loop is replaced, and
+    the replaced bot's connection pool is shut down.
+    
+    Args:
+        bot_token: Telegram bot token
+        
+    Returns:
+        telegram.Bot instance
+    """
+    global _bot, _bot_request, _bot_loop
+    loop = asyncio.get_running_loop()
+    if _bot is not None and _bot.token == bot_token and _bot_loop is loop:
+        return _bot
+    
+    # Swap in the new bot before awaiting, so concurrent sends share it
+    old_request = _bot_request
+    _bot_request = HTTPXRequest(connection_pool_size=_CONNECTION_POOL_SIZE)
+    _bot = Bot(token=bot_token, request=_bot_request)
+    _bot_loop = loop
+    
+    if old_request is not None:
+        try:
+            await old_request.shutdown()
+        except Exception as e:
+            # Sockets opened on a loop that has since closed cannot be shut down cleanly
+            logger.warning("Failed to shut down replaced bot connection pool: %s", e)
+    return _bot
+
+
+async def send_message(
+    bot_token: str,
+    user_id: int,
+    message: str,
+    on_unreachable: Optional[Callable[[int], None]] = None
+) -> bool:
     """
     Send a message to a user via Telegram bot.
     
@@ -17,31 +101,95 @@ async def send_message(bot_token: str, user_id: int, message: str) -> bool:
         bot_token: Telegram bot token
         user_id: Telegram user ID to send message to
         message: Message text to send
+        on_unreachable: Called with user_id if the bot was blocked or the
+            chat no longer exists
         
     Returns:
         True if message sent successfully, False otherwise
     """
+    if Bot is None:
+        logger.error("python-telegram-bot not installed. Install with: pip install python-telegram-bot")
+        return False
+    
     try:
-        from telegram import Bot
-        from telegram.error import TelegramError
+        bot = await _get_bot(bot_token)
         
-        bot = Bot(token=bot_token)
+        for attempt in range(_SEND_ATTEMPTS):
+            try:
+                # Send message to user
+                await bot.send_message(
+                    chat_id=user_id,
+                    text=message,
+                    disable_notification=True,
+                    parse_mode='HTML'
+                )
+                
+                logger.info("Successfully sent message to user %s", user_id)
+                return True
+            except RetryAfter as e:
+                # Only this send waits; other sends keep going meanwhile
+                delay = float(e.retry_after) + 0.1
+            except BadRequest:
+                # Not transient (BadRequest subclasses NetworkError)
+                raise
+            except NetworkError:
+                delay = _BACKOFF_BASE_SECONDS * 2 ** attempt
+                if attempt == _SEND_ATTEMPTS - 1:
+                    raise
+            
+            if attempt < _SEND_ATTEMPTS - 1:
+                logger.warning(
+                    "Retrying message to user %s in %.1fs (attempt %d/%d)",
+                    user_id, delay, attempt + 2, _SEND_ATTEMPTS
+                )
+                await asyncio.sleep(delay)
         
-        # Send message to user
-        await bot.send_message(
-            chat_id=user_id,
-            text=message,
-            disable_notification=True,
-            parse_mode='HTML'
-        )
-        
-        logger.info(f"Successfully sent message to user {user_id}")
-        return True
+        logger.error("Giving up on message to user %s after %d attempts", user_id, _SEND_ATTEMPTS)
+        return False
         
+    except TelegramError as e:
+        logger.error("Telegram error sending message to user %s: %s", user_id, e)
+        if on_unreachable is not None and _is_unreachable_chat(e):
+            on_unreachable(user_id)
+        return False
     except Exception as e:
-        if hasattr(e, '__class__') and 'TelegramError' in str(e.__class__):
-            logger.error(f"Telegram error sending message to user {user_id}: {e}")
-        else:
-            logger.error(f"Error sending message to user {user_id}: {e}")
+        logger.error("Error sending message to user %s: %s", user_id, e)
         return False
 
+
+async def broadcast(
+    bot_token: str,
+    chat_ids: List[int],
+    message: str,
+    on_unreachable: Optional[Callable[[int], None]] = None
+) -> List[Union[bool, BaseException]]:
+    """
+    Send the same message to many chats concurrently.
+    
+    Sends share one Bot (and its connection pool). To stay under Telegram's
+    rate limit, at most _BROADCAST_CONCURRENCY are in flight and each batch of
+    _BROADCAST_BATCH_SIZE starts one second after the previous one.
+    
+    Args:
+        bot_token: Telegram bot token
+        chat_ids: Telegram chat IDs to send message to
+        message: Message text to send
+        on_unreachable: Passed through to send_message
+        
+    Returns:
+        Result of send_message (or the exception it raised) per chat ID,
+        in the order of chat_ids
+    """
+    semaphore = asyncio.Semaphore(_BROADCAST_CONCURRENCY)
+    
+    async def _send_bounded(index: int, chat_id: int) -> bool:
+        batch = index // _BROADCAST_BATCH_SIZE
+        if batch:
+            await asyncio.sleep(batch)
+        async with semaphore:
+            return await send_message(bot_token, chat_id, message, on_unreachable=on_unreachable)
+    
+    return await asyncio.gather(
+        *(_send_bounded(index, chat_id) for index, chat_id in enumerate(chat_ids)),
+        return_exceptions=True
+    )